@@ -1,8 +1,23 @@
 import gradio as gr
-import subprocess
+import asyncio
+import functools
+import io
+import itertools
+import json
+import logging
+import os
 import re
+import time
+from collections import OrderedDict
 from datetime import datetime
-from collections import defaultdict
+from operator import itemgetter
+
+try:
+    import pyslurm  # Optional: query slurmctld directly instead of spawning sinfo
+except ImportError:
+    pyslurm = None
+
+_log = logging.getLogger(__name__)
 
 # GPU memory mapping (in GB)
 GPU_MEMORY = {
@@ -22,98 +37,295 @@ GPU_MEMORY = {
     'titan': 24,     # Titan RTX
 }
 
-def get_detailed_partition_info():
-    """Get detailed partition information including resource allocation"""
+# Longest keys first so e.g. 'rtx2080ti' is tried before '2080ti'
+_GPU_KEYS = tuple(sorted(GPU_MEMORY.items(), key=lambda kv: -len(kv[0])))
+
+# Whether this Slurm's sinfo supports --json; None until the first query finds out
+_SINFO_JSON = None
+
+# Whether to try pyslurm first; cleared once the installed pyslurm turns out not to match this code
+_PYSLURM_OK = pyslurm is not None
+
+# Cache parsed sinfo results so UI refreshes don't hit the Slurm controller every time
+_SINFO_TTL = float(os.environ.get('SINFO_TTL', '30'))  # seconds
+_SINFO_CACHE = {'ts': 0, 'fetched_at': None, 'data': None, 'error': None}  # ts is monotonic, fetched_at wall-clock
+_SINFO_LOCK = asyncio.Lock()  # Concurrent refreshes share a single sinfo call
+
+def _sinfo_cache_fresh():
+    return _SINFO_CACHE['ts'] and time.monotonic() - _SINFO_CACHE['ts'] < _SINFO_TTL
+
+async def get_detailed_partition_info():
+    """Get (partitions, error, fetched_at) partition information, reusing results younger than SINFO_TTL seconds"""
+    if _sinfo_cache_fresh():
+        return _SINFO_CACHE['data'], _SINFO_CACHE['error'], _SINFO_CACHE['fetched_at']
+    
+    async with _SINFO_LOCK:
+        # Another request may have refreshed the cache while we were waiting
+        if not _sinfo_cache_fresh():
+            data, error = await _query_partition_info()
+            _SINFO_CACHE.update(ts=time.monotonic(), fetched_at=datetime.now(), data=data, error=error)
+    
+    return _SINFO_CACHE['data'], _SINFO_CACHE['error'], _SINFO_CACHE['fetched_at']
+
+def _new_partition_entry(partition_name, timelimit):
+    """Empty per-partition record filled in by the sinfo/pyslurm parsers"""
+    return {
+        'name': partition_name,
+        'allocated_nodes': 0,
+        'idle_nodes': 0,
+        'other_nodes': 0,
+        'total_nodes': 0,
+        'allocated_cpus': 0,
+        'idle_cpus': 0,
+        'other_cpus': 0,
+        'total_cpus': 0,
+        'timelimit': timelimit,
+        'states': []
+    }
+
+def _classify_node_state(state):
+    """Map a Slurm node state to the sinfo %F bucket: 'allocated', 'idle' or 'other'"""
+    state = state.upper()
+    if any(flag in state for flag in ('DOWN', 'DRAIN', 'FAIL', 'MAINT', 'RESERVED', 'UNKNOWN', 'NOT_RESPONDING')):
+        return 'other'
+    if state.startswith(('ALLOC', 'MIX', 'COMPLETING')):
+        return 'allocated'
+    if state.startswith('IDLE'):
+        return 'idle'
+    return 'other'
+
+def _query_pyslurm():
+    """Aggregate partition resources from pyslurm RPCs, using the same schema as the sinfo parser"""
+    parts = pyslurm.partition().get()
+    nodes = pyslurm.node().get()
+    
+    partitions = {}
+    for partition_name, part in parts.items():
+        # Print unlimited partitions as 'infinite', like sinfo's %l and _format_timelimit
+        timelimit = part.get('max_time_str')
+        if not timelimit or timelimit.upper() in ('UNLIMITED', 'INFINITE'):
+            timelimit = 'infinite'
+        partitions[partition_name] = _new_partition_entry(partition_name, timelimit)
+    
+    for node in nodes.values():
+        state = node.get('state') or 'UNKNOWN'
+        bucket = _classify_node_state(state)
+        cpus = node.get('cpus') or 0
+        alloc_cpus = node.get('alloc_cpus') or 0
+        
+        for partition_name in node.get('partitions') or []:
+            entry = partitions.get(partition_name)
+            if entry is None:
+                continue
+            
+            entry['total_nodes'] += 1
+            entry['total_cpus'] += cpus
+            if bucket == 'other':
+                entry['other_nodes'] += 1
+                entry['other_cpus'] += cpus
+            else:
+                entry['allocated_nodes' if bucket == 'allocated' else 'idle_nodes'] += 1
+                entry['allocated_cpus'] += alloc_cpus
+                entry['idle_cpus'] += cpus - alloc_cpus
+            entry['states'].append(state.lower())
+    
+    return list(partitions.values()), None
+
+async def _query_partition_info():
+    """Aggregate resource allocation per partition via pyslurm, falling back to sinfo"""
+    global _PYSLURM_OK, _SINFO_JSON
+    if _PYSLURM_OK:
+        try:
+            return await asyncio.to_thread(_query_pyslurm)
+        except (AttributeError, ImportError) as e:
+            # API or libslurm mismatch won't go away on retry, so stop paying for it
+            _PYSLURM_OK = False
+            _log.warning("pyslurm is unusable (%r); using sinfo from now on", e)
+        except Exception as e:
+            _log.warning("pyslurm query failed (%r); falling back to sinfo", e)
+    
+    if _SINFO_JSON is not False:
+        try:
+            result = await _query_sinfo_json()
+        except asyncio.TimeoutError:
+            return None, "sinfo command timed out"
+        except Exception:
+            result = None
+        
+        # Remember when --json is rejected so older Slurm skips straight to the text parser;
+        # other failures (controller down, bad payload) just fall back for this query
+        if result is False:
+            _SINFO_JSON = False
+        elif result is not None:
+            _SINFO_JSON = True
+            return result
+    
+    return await _query_sinfo_text()
+
+def _format_timelimit(limit):
+    """Format a JSON time limit (minutes) the way sinfo's %l field prints it"""
+    if isinstance(limit, dict):  # Slurm >= 23.11: {"set": ..., "infinite": ..., "number": ...}
+        if limit.get('infinite') or not limit.get('set', True):
+            return 'infinite'
+        limit = limit.get('number', 0)
+    
+    days, minutes = divmod(int(limit), 24 * 60)
+    hours, minutes = divmod(minutes, 60)
+    if days:
+        return f"{days}-{hours:02d}:{minutes:02d}:00"
+    if hours:
+        return f"{hours}:{minutes:02d}:00"
+    return f"{minutes}:00"
+
+async def _query_sinfo_json():
+    """Aggregate partition resources from `sinfo --json`; False if --json is unusable here, None if it failed"""
+    proc = await asyncio.create_subprocess_exec(
+        'sinfo', '--json',
+        stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=10)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    
+    if proc.returncode != 0:
+        # An unknown option (getopt) or a missing JSON serializer plugin won't change on retry
+        if any(msg in stderr for msg in (b'unrecognized option', b'invalid option', b'serializer/json')):
+            return False
+        return None
+    
+    try:
+        data = json.loads(stdout)
+    except ValueError:
+        return None
+    
+    # Pre-23.11 Slurm prints separate nodes/partitions lists instead of per-partition sinfo rows
+    if not isinstance(data, dict) or 'sinfo' not in data:
+        return False
+    entries = data['sinfo']
+    
+    if not entries:
+        return None, "No sinfo output"
+    
+    partitions = {}
+    
+    for entry in entries:
+        partition_name = entry['partition']['name']
+        node_info = entry['nodes']
+        cpu_info = entry['cpus']
+        
+        if partition_name not in partitions:
+            timelimit = _format_timelimit(entry['partition'].get('maximums', {}).get('time', {'infinite': True}))
+            partitions[partition_name] = _new_partition_entry(partition_name, timelimit)
+        
+        partitions[partition_name]['allocated_nodes'] += node_info['allocated']
+        partitions[partition_name]['idle_nodes'] += node_info['idle']
+        partitions[partition_name]['other_nodes'] += node_info['other']
+        partitions[partition_name]['total_nodes'] += node_info['total']
+        partitions[partition_name]['allocated_cpus'] += cpu_info['allocated']
+        partitions[partition_name]['idle_cpus'] += cpu_info['idle']
+        partitions[partition_name]['other_cpus'] += cpu_info['other']
+        partitions[partition_name]['total_cpus'] += cpu_info['total']
+        partitions[partition_name]['states'].append('+'.join(entry['node']['state']).lower())
+    
+    return list(partitions.values()), None
+
+async def _parse_sinfo_lines(stream):
+    """Aggregate `sinfo -o` rows per partition as they arrive on the pipe"""
+    partitions = {}
+    row_count = 0
+    
+    async for line in stream:
+        row_count += 1
+        parts = line.decode().split()
+        if len(parts) >= 5:
+            partition_name = parts[0].replace('*', '')
+            
+            # Parse nodes info: allocated/idle/other/total
+            node_info = parts[1].split('/')
+            if len(node_info) == 4:
+                allocated_nodes = int(node_info[0])
+                idle_nodes = int(node_info[1])
+                other_nodes = int(node_info[2])
+                total_nodes = int(node_info[3])
+            else:
+                continue
+            
+            # Parse CPU info: allocated/idle/other/total
+            cpu_info = parts[2].split('/')
+            if len(cpu_info) == 4:
+                allocated_cpus = int(cpu_info[0])
+                idle_cpus = int(cpu_info[1])
+                other_cpus = int(cpu_info[2])
+                total_cpus = int(cpu_info[3])
+            else:
+                continue
+            
+            timelimit = parts[3]
+            state = parts[4]
+            
+            # Aggregate by partition name (handle multiple lines for same partition)
+            if partition_name not in partitions:
+                partitions[partition_name] = _new_partition_entry(partition_name, timelimit)
+            
+            partitions[partition_name]['allocated_nodes'] += allocated_nodes
+            partitions[partition_name]['idle_nodes'] += idle_nodes
+            partitions[partition_name]['other_nodes'] += other_nodes
+            partitions[partition_name]['total_nodes'] += total_nodes
+            partitions[partition_name]['allocated_cpus'] += allocated_cpus
+            partitions[partition_name]['idle_cpus'] += idle_cpus
+            partitions[partition_name]['other_cpus'] += other_cpus
+            partitions[partition_name]['total_cpus'] += total_cpus
+            partitions[partition_name]['states'].append(state)
+    
+    return partitions, row_count
+
+async def _query_sinfo_text():
+    """Parse the legacy `sinfo -o` text output for Slurm releases without --json"""
     try:
-        # Get detailed partition info with CPU allocation
-        result = subprocess.run(
-            ['sinfo', '-o', '%P %F %C %D %l %T %N'],
-            capture_output=True, text=True, timeout=10
+        # Get detailed partition info with CPU allocation, parsing lines as sinfo writes them
+        proc = await asyncio.create_subprocess_exec(
+            'sinfo', '-h', '-o', '%P %F %C %l %T',
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
         )
         
-        if result.returncode != 0:
+        try:
+            partitions, row_count = await asyncio.wait_for(_parse_sinfo_lines(proc.stdout), timeout=10)
+            returncode = await proc.wait()
+        except asyncio.TimeoutError:
+            return None, "sinfo command timed out"
+        finally:
+            if proc.returncode is None:  # Timed out or parsing failed before sinfo exited
+                proc.kill()
+                await proc.wait()
+        
+        if returncode != 0:
             return None, "Error running sinfo command"
         
-        lines = result.stdout.strip().split('\n')
-        if len(lines) < 2:
+        if row_count == 0:
             return None, "No sinfo output"
         
-        partitions = {}
-        
-        for line in lines[1:]:  # Skip header
-            parts = line.split()
-            if len(parts) >= 7:
-                partition_name = parts[0].replace('*', '')
-                
-                # Parse nodes info: allocated/idle/other/total
-                node_info = parts[1].split('/')
-                if len(node_info) == 4:
-                    allocated_nodes = int(node_info[0])
-                    idle_nodes = int(node_info[1])
-                    other_nodes = int(node_info[2])
-                    total_nodes = int(node_info[3])
-                else:
-                    continue
-                
-                # Parse CPU info: allocated/idle/other/total
-                cpu_info = parts[2].split('/')
-                if len(cpu_info) == 4:
-                    allocated_cpus = int(cpu_info[0])
-                    idle_cpus = int(cpu_info[1])
-                    other_cpus = int(cpu_info[2])
-                    total_cpus = int(cpu_info[3])
-                else:
-                    continue
-                
-                nodes_count = int(parts[3])
-                timelimit = parts[4]
-                state = parts[5]
-                nodelist = ' '.join(parts[6:])
-                
-                # Aggregate by partition name (handle multiple lines for same partition)
-                if partition_name not in partitions:
-                    partitions[partition_name] = {
-                        'name': partition_name,
-                        'allocated_nodes': 0,
-                        'idle_nodes': 0,
-                        'other_nodes': 0,
-                        'total_nodes': 0,
-                        'allocated_cpus': 0,
-                        'idle_cpus': 0,
-                        'other_cpus': 0,
-                        'total_cpus': 0,
-                        'timelimit': timelimit,
-                        'states': [],
-                        'nodelists': []
-                    }
-                
-                partitions[partition_name]['allocated_nodes'] += allocated_nodes
-                partitions[partition_name]['idle_nodes'] += idle_nodes
-                partitions[partition_name]['other_nodes'] += other_nodes
-                partitions[partition_name]['total_nodes'] += total_nodes
-                partitions[partition_name]['allocated_cpus'] += allocated_cpus
-                partitions[partition_name]['idle_cpus'] += idle_cpus
-                partitions[partition_name]['other_cpus'] += other_cpus
-                partitions[partition_name]['total_cpus'] += total_cpus
-                partitions[partition_name]['states'].append(state)
-                partitions[partition_name]['nodelists'].append(nodelist)
-        
         return list(partitions.values()), None
         
-    except subprocess.TimeoutExpired:
-        return None, "sinfo command timed out"
     except Exception as e:
         return None, f"Error: {str(e)}"
 
+@functools.lru_cache(maxsize=256)
 def infer_gpu_memory(partition_name):
     """Infer GPU memory from partition name"""
     partition_lower = partition_name.lower()
-    
-    for gpu_type, memory in GPU_MEMORY.items():
-        if gpu_type in partition_lower:
-            return memory
-    
-    return None
+    return next((memory for gpu_type, memory in _GPU_KEYS if gpu_type in partition_lower), None)
+
+# Progress bar (upper percentage bound, bar color, background color), checked in order
+_BAR_COLORS = (
+    (40, '#66BB6A', '#C8E6C9'),            # Green
+    (70, '#FFA726', '#FFE0B2'),            # Orange
+    (90, '#FFA726', '#FFE0B2'),            # Orange
+    (float('inf'), '#EF5350', '#FFCDD2'),  # Red
+)
 
 def create_progress_bar(used, total, color_scheme='green'):
     """Create an HTML progress bar"""
@@ -125,18 +337,7 @@ def create_progress_bar(used, total, color_scheme='green'):
     available = total - used
     
     # Color schemes based on availability
-    if percentage >= 90:
-        bar_color = '#EF5350'  # Red
-        bg_color = '#FFCDD2'
-    elif percentage >= 70:
-        bar_color = '#FFA726'  # Orange
-        bg_color = '#FFE0B2'
-    elif percentage >= 40:
-        bar_color = '#FFA726'  # Orange
-        bg_color = '#FFE0B2'
-    else:
-        bar_color = '#66BB6A'  # Green
-        bg_color = '#C8E6C9'
+    bar_color, bg_color = next((bar, bg) for threshold, bar, bg in _BAR_COLORS if percentage < threshold)
     
     html = f"""
     <div style='width: 100%; background: {bg_color}; border-radius: 8px; overflow: hidden; height: 24px; position: relative;'>
@@ -148,98 +349,186 @@ def create_progress_bar(used, total, color_scheme='green'):
     """
     return html
 
-def get_available_resources(min_gpu_memory=0):
-    """Get available GPU/CPU resources with detailed progress bars"""
-    partitions, error = get_detailed_partition_info()
+# Display style for each dominant partition state
+_STATE_INFO = {
+    'mix': {'emoji': '🟡', 'color': '#FFA726', 'text': 'Partially Available'},
+    'alloc': {'emoji': '🔴', 'color': '#EF5350', 'text': 'Heavily Used'},
+    'idle': {'emoji': '🟢', 'color': '#66BB6A', 'text': 'Available'},
+    'down': {'emoji': '⚫', 'color': '#757575', 'text': 'Unavailable'}
+}
+_UNKNOWN_STATE = {'emoji': '⚪', 'color': '#BDBDBD', 'text': 'Unknown'}
+
+# State legend shown under the resource report; it never changes
+_LEGEND_HTML = (
+    "<div style='margin-top: 30px; padding: 20px; background: #f5f5f5; border-radius: 10px;'>\n"
+    "<h4 style='margin-top: 0; color: #333;'>📖 Legend</h4>\n"
+    "<div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 10px;'>\n"
+    + "".join(
+        f"<div style='background: white; padding: 10px; border-radius: 5px; border-left: 4px solid {color};'>"
+        f"{emoji} <strong>{state}</strong>: {desc}"
+        f"</div>\n"
+        for emoji, color, state, desc in [
+            ('🟢', '#66BB6A', 'Available', 'Resources ready to use'),
+            ('🟡', '#FFA726', 'Partially Available', 'Some resources in use'),
+            ('🔴', '#EF5350', 'Heavily Used', 'Most resources allocated'),
+            ('⚫', '#757575', 'Unavailable', 'Offline or maintenance')
+        ]
+    )
+    + "</div>\n"
+    "</div>"
+)
+
+# Report header around the "Updated" timestamp
+_HEADER_PREFIX = (
+    "<div style='text-align: center; padding: 20px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; border-radius: 10px; margin-bottom: 20px;'>\n"
+    "<h2 style='margin: 0; font-size: 24px;'>📊 Cluster Resource Status</h2>\n"
+    "<p style='margin: 10px 0 0 0; opacity: 0.9;'>Updated: "
+)
+_HEADER_SUFFIX = (
+    "</p>\n"
+    "</div>\n"
+    "\n"
+)
+
+# One row of the "Best Available GPUs" table; placeholders are filtered_results fields
+_RESULT_ROW_TEMPLATE = (
+    "<tr style='background: {bg_color};'>"
+    "<td style='padding: 12px; border-bottom: 1px solid #ddd; font-size: 16px;'>{medal}</td>"
+    "<td style='padding: 12px; border-bottom: 1px solid #ddd;'><strong>{partition}</strong></td>"
+    "<td style='padding: 12px; text-align: center; border-bottom: 1px solid #ddd;'>{gpu_memory}GB</td>"
+    "<td style='padding: 12px; text-align: center; border-bottom: 1px solid #ddd;'><strong style='color: #4CAF50; font-size: 16px;'>{total_available_gpu_memory}GB</strong><br><span style='font-size: 12px; color: #666;'>({gpu_memory}GB × {available_nodes} nodes)</span></td>"
+    "<td style='padding: 12px; text-align: center; border-bottom: 1px solid #ddd;'><span style='background: #2196F3; color: white; padding: 4px 12px; border-radius: 12px; font-size: 13px; font-weight: 600;'>{available_nodes}</span></td>"
+    "<td style='padding: 12px; text-align: center; border-bottom: 1px solid #ddd;'><span style='background: #66BB6A; color: white; padding: 4px 12px; border-radius: 12px; font-size: 13px; font-weight: 600;'>{idle_nodes}</span></td>"
+    "<td style='padding: 12px; border-bottom: 1px solid #ddd;'>{timelimit}</td>"
+    "</tr>\n"
+)
+_MEDALS = ('🥇', '🥈', '🥉')
+
+# Rendered resource report bodies keyed on (min_gpu_memory, partition counts), least recently used first
+_HTML_CACHE = OrderedDict()
+_HTML_CACHE_SIZE = 16
+
+# One partition card: state header, node/CPU progress bars and detailed stats.
+# Placeholders are partition fields, filled in by _render_partition_card.
+_CARD_TEMPLATE = (
+    "<div style='padding: 15px; margin: 10px 0; background: white; border-left: 4px solid {state_color}; border-radius: 5px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>\n"
+    "<div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;'>"
+    "<div>"
+    "<strong style='font-size: 18px;'>{state_emoji} {name}</strong> "
+    "<span style='color: {state_color}; font-weight: 600; font-size: 14px;'>{state_text}</span>"
+    "{gpu_line}"
+    "</div>"
+    "<div style='color: #666; font-size: 14px;'>⏱️ Time Limit: {timelimit}</div>"
+    "</div>\n"
+    "<div style='margin: 10px 0;'>\n"
+    "<div style='font-size: 13px; color: #666; margin-bottom: 5px; font-weight: 600;'>📦 Node Usage:</div>\n"
+    "{bar_html_nodes}\n"
+    "</div>\n"
+    "<div style='margin: 10px 0;'>\n"
+    "<div style='font-size: 13px; color: #666; margin-bottom: 5px; font-weight: 600;'>🔧 CPU Usage:</div>\n"
+    "{bar_html_cpus}\n"
+    "</div>\n"
+    "<div style='margin-top: 10px; padding-top: 10px; border-top: 1px solid #eee; font-size: 13px; color: #666;'>"
+    "<strong>Details:</strong> "
+    "Idle Nodes: {idle_nodes} | "
+    "Allocated Nodes: {allocated_nodes} | "
+    "Total CPUs: {total_cpus} | "
+    "Available CPUs: {idle_cpus}"
+    "</div>\n"
+    "</div>\n"
+)
+_GPU_LINE_TEMPLATE = "<br><span style='color: #667eea; font-weight: 600; font-size: 13px;'>🎮 Available GPU Memory: {_avail_gpu_mem}GB ({gpu_memory}GB × {_available_nodes} nodes)</span>"
+
+def _render_partition_card(partition):
+    """Render a partition card; GPU partitions also show their available GPU memory"""
+    state_info = _STATE_INFO.get(partition['dominant_state'], _UNKNOWN_STATE)
     
-    if error:
-        return f"❌ **Error:** {error}"
+    # Add the display fields to the partition so the whole card is a single format_map
+    partition['state_emoji'] = state_info['emoji']
+    partition['state_color'] = state_info['color']
+    partition['state_text'] = state_info['text']
+    partition['gpu_line'] = _GPU_LINE_TEMPLATE.format_map(partition) if partition['gpu_memory'] else ''
+    partition['bar_html_nodes'] = create_progress_bar(partition['allocated_nodes'], partition['total_nodes'])
+    partition['bar_html_cpus'] = create_progress_bar(partition['allocated_cpus'], partition['total_cpus'])
     
+    return _CARD_TEMPLATE.format_map(partition)
+
+def _render_resources(partitions, min_gpu_memory):
+    """Render the resource report HTML (without the timestamped header) for the given partitions"""
     # Build resource summary with better formatting
-    summary = []
-    summary.append(f"<div style='text-align: center; padding: 20px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; border-radius: 10px; margin-bottom: 20px;'>")
-    summary.append(f"<h2 style='margin: 0; font-size: 24px;'>📊 Cluster Resource Status</h2>")
-    summary.append(f"<p style='margin: 10px 0 0 0; opacity: 0.9;'>Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>")
-    summary.append("</div>")
-    summary.append("")
+    buf = io.StringIO()
     
     # Categorize and sort partitions by GPU type
-    gpu_partitions = defaultdict(list)
+    gpu_partitions = []
     cpu_partitions = []
     filtered_results = []  # Initialize here to avoid UnboundLocalError
     
     for partition in partitions:
-        name = partition['name']
-        gpu_mem = infer_gpu_memory(name)
+        gpu_mem = infer_gpu_memory(partition['name'])
         
-        # Calculate availability score for sorting
+        # Compute available nodes robustly (nodes not allocated)
+        # Clamp at 0 to avoid negative numbers if data is inconsistent
         total_nodes = partition['total_nodes']
-        available_nodes = partition['idle_nodes'] + (partition['total_nodes'] - partition['allocated_nodes'] - partition['idle_nodes'] - partition['other_nodes'])
-        availability_score = available_nodes if total_nodes > 0 else 0
-        
-        partition['availability_score'] = availability_score
-        partition['gpu_memory'] = gpu_mem
-        
-        # if gpu_mem:
-        #     if min_gpu_memory == 0 or gpu_mem >= min_gpu_memory:
-        #         gpu_partitions[gpu_mem].append(partition)
-        # else:
-        #     cpu_partitions.append(partition)
-                # Compute available nodes robustly (nodes not allocated)
-        # Use max(0, ...) to avoid negative numbers if data is inconsistent
-        total_nodes = partition.get('total_nodes', 0)
-        allocated_nodes = partition.get('allocated_nodes', 0)
-        other_nodes = partition.get('other_nodes', 0)
+        allocated_nodes = partition['allocated_nodes']
+        idle_nodes = partition['idle_nodes']
         # available_nodes = total - allocated (we treat 'other' as not available)
-        available_nodes = max(0, total_nodes - allocated_nodes - other_nodes)
-
+        available_nodes = total_nodes - allocated_nodes - partition['other_nodes']
+        if available_nodes < 0:
+            available_nodes = 0
+        
         # store available_nodes for later use and correct availability score
         partition['available_nodes'] = available_nodes
-        availability_score = available_nodes if total_nodes > 0 else 0
-        partition['availability_score'] = availability_score
+        partition['availability_score'] = available_nodes if total_nodes > 0 else 0
         partition['gpu_memory'] = gpu_mem
-
-        # IMPORTANT FIX:
+        
+        # Determine primary state
+        partition['dominant_state'] = 'idle' if idle_nodes > allocated_nodes else 'mix' if idle_nodes > 0 else 'alloc'
+        
         # Don't filter GPU types here using per-card memory vs min_gpu_memory.
-        # We should keep all GPU types and apply the total-available check per partition later.
+        # Keep all GPU types and apply the total-available check per partition later.
         if gpu_mem:
-            gpu_partitions[gpu_mem].append(partition)
+            partition['_available_nodes'] = total_nodes - allocated_nodes
+            partition['_avail_gpu_mem'] = gpu_mem * partition['_available_nodes']
+            gpu_partitions.append(partition)
         else:
             cpu_partitions.append(partition)
-
     
-    # Sort each GPU memory category by availability (highest first)
-    for gpu_mem in gpu_partitions:
-        gpu_partitions[gpu_mem].sort(key=lambda x: (x['availability_score'], x['idle_nodes']), reverse=True)
+    # Sort GPU partitions by memory per GPU, then by availability (highest first)
+    gpu_partitions.sort(key=lambda x: (-x['gpu_memory'], -x['availability_score'], -x['idle_nodes']))
     
     # Sort CPU partitions by availability
     cpu_partitions.sort(key=lambda x: (x['availability_score'], x['idle_nodes']), reverse=True)
     
     # GPU Resources Section
     if gpu_partitions:
-        summary.append("<div style='margin: 20px 0;'>")
         if min_gpu_memory > 0:
-            summary.append(f"<h3 style='color: #667eea; border-bottom: 3px solid #667eea; padding-bottom: 10px;'>🎮 GPU Partitions with ≥ {min_gpu_memory}GB Total Available Memory</h3>")
-            summary.append(f"<p style='color: #666; font-size: 14px; margin-top: 10px;'>💡 Filtering by <strong>Total Available GPU Memory</strong> = GPU Memory per Card × Available Nodes (per partition)</p>")
+            buf.write(
+                "<div style='margin: 20px 0;'>\n"
+                f"<h3 style='color: #667eea; border-bottom: 3px solid #667eea; padding-bottom: 10px;'>🎮 GPU Partitions with ≥ {min_gpu_memory}GB Total Available Memory</h3>\n"
+                "<p style='color: #666; font-size: 14px; margin-top: 10px;'>💡 Filtering by <strong>Total Available GPU Memory</strong> = GPU Memory per Card × Available Nodes (per partition)</p>\n"
+                "</div>\n"
+            )
         else:
-            summary.append("<h3 style='color: #667eea; border-bottom: 3px solid #667eea; padding-bottom: 10px;'>🎮 All GPU Resources (Sorted by Availability)</h3>")
-        summary.append("</div>")
+            buf.write(
+                "<div style='margin: 20px 0;'>\n"
+                "<h3 style='color: #667eea; border-bottom: 3px solid #667eea; padding-bottom: 10px;'>🎮 All GPU Resources (Sorted by Availability)</h3>\n"
+                "</div>\n"
+            )
         
         has_displayed_gpu = False  # Track if we displayed any GPU
         displayed_gpu_types = 0  # Count actually displayed GPU types
+        total_gpu_types = 0
         
-        for gpu_mem in sorted(gpu_partitions.keys(), reverse=True):
-            partitions_list = gpu_partitions[gpu_mem]
+        for gpu_mem, group in itertools.groupby(gpu_partitions, key=itemgetter('gpu_memory')):
+            partitions_list = list(group)
+            total_gpu_types += 1
             
-            # Filter partitions at the individual partition level, not GPU type level
-            filtered_partitions = []
-            for partition in partitions_list:
-                partition_available_nodes = partition['total_nodes'] - partition['allocated_nodes']
-                partition_total_gpu_memory = gpu_mem * partition_available_nodes
-                
-                # Only include partitions that meet the memory requirement
-                if min_gpu_memory == 0 or partition_total_gpu_memory >= min_gpu_memory:
-                    filtered_partitions.append(partition)
+            # Filter partitions at the individual partition level, not GPU type level:
+            # only include partitions that meet the memory requirement
+            filtered_partitions = [
+                partition for partition in partitions_list
+                if min_gpu_memory == 0 or partition['_avail_gpu_mem'] >= min_gpu_memory
+            ]
             
             # Skip this GPU type if no partitions pass the filter
             if not filtered_partitions:
@@ -265,174 +554,75 @@ def get_available_resources(min_gpu_memory=0):
             else:
                 card_color = "#EF5350"  # Red
             
-            summary.append(f"<div style='background: {card_color}; color: white; padding: 15px; border-radius: 10px 10px 0 0; margin-top: 20px;'>")
             if min_gpu_memory > 0 and len(filtered_partitions) < len(partitions_list):
-                summary.append(f"<h4 style='margin: 0; font-size: 20px;'>💾 {gpu_mem}GB per GPU | Showing {len(filtered_partitions)} of {len(partitions_list)} partitions</h4>")
-                summary.append(f"<p style='margin: 5px 0 0 0; opacity: 0.9;'>Total Available in Shown Partitions: {total_available_gpu_memory}GB | {available_nodes_sum} available nodes, {idle_nodes_sum} idle</p>")
+                header_html = (
+                    f"<h4 style='margin: 0; font-size: 20px;'>💾 {gpu_mem}GB per GPU | Showing {len(filtered_partitions)} of {len(partitions_list)} partitions</h4>\n"
+                    f"<p style='margin: 5px 0 0 0; opacity: 0.9;'>Total Available in Shown Partitions: {total_available_gpu_memory}GB | {available_nodes_sum} available nodes, {idle_nodes_sum} idle</p>\n"
+                )
             else:
-                summary.append(f"<h4 style='margin: 0; font-size: 20px;'>💾 {gpu_mem}GB per GPU | Total Available: {total_available_gpu_memory}GB</h4>")
-                summary.append(f"<p style='margin: 5px 0 0 0; opacity: 0.9;'>Available Nodes: {available_nodes_sum} | Idle Nodes: {idle_nodes_sum} | Total Nodes: {total_nodes_sum}</p>")
-            summary.append("</div>")
+                header_html = (
+                    f"<h4 style='margin: 0; font-size: 20px;'>💾 {gpu_mem}GB per GPU | Total Available: {total_available_gpu_memory}GB</h4>\n"
+                    f"<p style='margin: 5px 0 0 0; opacity: 0.9;'>Available Nodes: {available_nodes_sum} | Idle Nodes: {idle_nodes_sum} | Total Nodes: {total_nodes_sum}</p>\n"
+                )
             
             # Partition details with progress bars
-            summary.append("<div style='background: #f8f9fa; padding: 15px; border-radius: 0 0 10px 10px; margin-bottom: 10px;'>")
+            buf.write(
+                f"<div style='background: {card_color}; color: white; padding: 15px; border-radius: 10px 10px 0 0; margin-top: 20px;'>\n"
+                f"{header_html}"
+                "</div>\n"
+                "<div style='background: #f8f9fa; padding: 15px; border-radius: 0 0 10px 10px; margin-bottom: 10px;'>\n"
+            )
             
-            for partition in filtered_partitions:
-                # Determine primary state
-                dominant_state = 'idle' if partition['idle_nodes'] > partition['allocated_nodes'] else 'mix' if partition['idle_nodes'] > 0 else 'alloc'
-                
-                state_info = {
-                    'mix': {'emoji': '🟡', 'color': '#FFA726', 'text': 'Partially Available'},
-                    'alloc': {'emoji': '🔴', 'color': '#EF5350', 'text': 'Heavily Used'},
-                    'idle': {'emoji': '🟢', 'color': '#66BB6A', 'text': 'Available'},
-                    'down': {'emoji': '⚫', 'color': '#757575', 'text': 'Unavailable'}
-                }.get(dominant_state, {'emoji': '⚪', 'color': '#BDBDBD', 'text': 'Unknown'})
-                
-                summary.append(
-                    f"<div style='padding: 15px; margin: 10px 0; background: white; border-left: 4px solid {state_info['color']}; border-radius: 5px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>"
-                )
-                
-                # Partition header
-                partition_available_nodes = partition['total_nodes'] - partition['allocated_nodes']
-                partition_available_gpu_memory = gpu_mem * partition_available_nodes
-                
-                summary.append(
-                    f"<div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;'>"
-                    f"<div>"
-                    f"<strong style='font-size: 18px;'>{state_info['emoji']} {partition['name']}</strong> "
-                    f"<span style='color: {state_info['color']}; font-weight: 600; font-size: 14px;'>{state_info['text']}</span>"
-                    f"<br><span style='color: #667eea; font-weight: 600; font-size: 13px;'>🎮 Available GPU Memory: {partition_available_gpu_memory}GB ({gpu_mem}GB × {partition_available_nodes} nodes)</span>"
-                    f"</div>"
-                    f"<div style='color: #666; font-size: 14px;'>⏱️ Time Limit: {partition['timelimit']}</div>"
-                    f"</div>"
-                )
-                
-                # Node usage progress bar
-                summary.append("<div style='margin: 10px 0;'>")
-                summary.append("<div style='font-size: 13px; color: #666; margin-bottom: 5px; font-weight: 600;'>📦 Node Usage:</div>")
-                summary.append(create_progress_bar(
-                    partition['allocated_nodes'],
-                    partition['total_nodes']
-                ))
-                summary.append("</div>")
-                
-                # CPU usage progress bar
-                summary.append("<div style='margin: 10px 0;'>")
-                summary.append("<div style='font-size: 13px; color: #666; margin-bottom: 5px; font-weight: 600;'>🔧 CPU Usage:</div>")
-                summary.append(create_progress_bar(
-                    partition['allocated_cpus'],
-                    partition['total_cpus']
-                ))
-                summary.append("</div>")
-                
-                # Detailed stats
-                summary.append(
-                    f"<div style='margin-top: 10px; padding-top: 10px; border-top: 1px solid #eee; font-size: 13px; color: #666;'>"
-                    f"<strong>Details:</strong> "
-                    f"Idle Nodes: {partition['idle_nodes']} | "
-                    f"Allocated Nodes: {partition['allocated_nodes']} | "
-                    f"Total CPUs: {partition['total_cpus']} | "
-                    f"Available CPUs: {partition['idle_cpus'] + (partition['total_cpus'] - partition['allocated_cpus'] - partition['idle_cpus'] - partition['other_cpus'])}"
-                    f"</div>"
-                )
-                
-                summary.append("</div>")
-                
-                # Add to filtered results if available
-                if partition['idle_nodes'] > 0 or (partition['total_nodes'] - partition['allocated_nodes']) > 0:
-                    available_nodes = partition['total_nodes'] - partition['allocated_nodes']
-                    total_gpu_memory = gpu_mem * available_nodes
-                    filtered_results.append({
-                        'partition': partition['name'],
-                        'gpu_memory': gpu_mem,
-                        'total_nodes': partition['total_nodes'],
-                        'available_nodes': available_nodes,
-                        'idle_nodes': partition['idle_nodes'],
-                        'allocated_nodes': partition['allocated_nodes'],
-                        'timelimit': partition['timelimit'],
-                        'total_available_gpu_memory': total_gpu_memory,
-                        'availability_pct': (available_nodes / partition['total_nodes'] * 100) if partition['total_nodes'] > 0 else 0
-                    })
+            buf.writelines(map(_render_partition_card, filtered_partitions))
+            buf.write("</div>\n")
             
-            summary.append("</div>")
+            # Add to filtered results if available
+            filtered_results.extend(
+                {
+                    'partition': partition['name'],
+                    'gpu_memory': gpu_mem,
+                    'total_nodes': partition['total_nodes'],
+                    'available_nodes': partition['_available_nodes'],
+                    'idle_nodes': partition['idle_nodes'],
+                    'allocated_nodes': partition['allocated_nodes'],
+                    'timelimit': partition['timelimit'],
+                    'total_available_gpu_memory': partition['_avail_gpu_mem'],
+                    'availability_pct': (partition['_available_nodes'] / partition['total_nodes'] * 100) if partition['total_nodes'] > 0 else 0
+                }
+                for partition in filtered_partitions
+                if partition['idle_nodes'] > 0 or partition['_available_nodes'] > 0
+            )
         
         # Show statistics after the loop
         if min_gpu_memory > 0 and has_displayed_gpu:
-            total_gpu_types = len(gpu_partitions)
-            summary.append(f"<div style='margin: 20px 0; padding: 15px; background: #E3F2FD; border-radius: 8px; border-left: 4px solid #2196F3;'>")
-            summary.append(f"<p style='margin: 0; color: #1976D2; font-size: 14px;'>✅ Showing <strong>{displayed_gpu_types} of {total_gpu_types}</strong> GPU types with partitions meeting the ≥{min_gpu_memory}GB requirement</p>")
-            summary.append("</div>")
+            buf.write(
+                "<div style='margin: 20px 0; padding: 15px; background: #E3F2FD; border-radius: 8px; border-left: 4px solid #2196F3;'>\n"
+                f"<p style='margin: 0; color: #1976D2; font-size: 14px;'>✅ Showing <strong>{displayed_gpu_types} of {total_gpu_types}</strong> GPU types with partitions meeting the ≥{min_gpu_memory}GB requirement</p>\n"
+                "</div>\n"
+            )
         
         # If no GPUs were displayed due to filtering, show a message
         if not has_displayed_gpu and min_gpu_memory > 0:
-            summary.append("<div style='padding: 30px; background: #FFF3E0; border-radius: 10px; border: 2px dashed #FF9800; text-align: center;'>")
-            summary.append(f"<h4 style='color: #F57C00; margin-top: 0;'>🔍 No GPU Partitions Found</h4>")
-            summary.append(f"<p style='color: #666;'>No GPU partitions have ≥{min_gpu_memory}GB of <strong>total available GPU memory</strong>.</p>")
-            summary.append(f"<p style='color: #666;'><strong>Total Available GPU Memory</strong> = GPU Memory per Card × Available Nodes</p>")
-            summary.append("<p style='color: #666;'>Try lowering the memory filter or check back later when more nodes are available.</p>")
-            summary.append("</div>")
+            buf.write(
+                "<div style='padding: 30px; background: #FFF3E0; border-radius: 10px; border: 2px dashed #FF9800; text-align: center;'>\n"
+                "<h4 style='color: #F57C00; margin-top: 0;'>🔍 No GPU Partitions Found</h4>\n"
+                f"<p style='color: #666;'>No GPU partitions have ≥{min_gpu_memory}GB of <strong>total available GPU memory</strong>.</p>\n"
+                "<p style='color: #666;'><strong>Total Available GPU Memory</strong> = GPU Memory per Card × Available Nodes</p>\n"
+                "<p style='color: #666;'>Try lowering the memory filter or check back later when more nodes are available.</p>\n"
+                "</div>\n"
+            )
     
     # CPU Resources Section
     if cpu_partitions:
-        summary.append("<div style='margin: 30px 0 20px 0;'>")
-        summary.append("<h3 style='color: #764ba2; border-bottom: 3px solid #764ba2; padding-bottom: 10px;'>💻 CPU-Only Resources (Sorted by Availability)</h3>")
-        summary.append("</div>")
-        
-        summary.append("<div style='background: #f8f9fa; padding: 15px; border-radius: 10px;'>")
-        
-        for partition in cpu_partitions:
-            dominant_state = 'idle' if partition['idle_nodes'] > partition['allocated_nodes'] else 'mix' if partition['idle_nodes'] > 0 else 'alloc'
-            
-            state_info = {
-                'mix': {'emoji': '🟡', 'color': '#FFA726', 'text': 'Partially Available'},
-                'alloc': {'emoji': '🔴', 'color': '#EF5350', 'text': 'Heavily Used'},
-                'idle': {'emoji': '🟢', 'color': '#66BB6A', 'text': 'Available'},
-                'down': {'emoji': '⚫', 'color': '#757575', 'text': 'Unavailable'}
-            }.get(dominant_state, {'emoji': '⚪', 'color': '#BDBDBD', 'text': 'Unknown'})
-            
-            summary.append(
-                f"<div style='padding: 15px; margin: 10px 0; background: white; border-left: 4px solid {state_info['color']}; border-radius: 5px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);'>"
-            )
-            
-            summary.append(
-                f"<div style='display: flex; justify-content: space-between; align-items: center; margin-bottom: 10px;'>"
-                f"<div><strong style='font-size: 18px;'>{state_info['emoji']} {partition['name']}</strong> "
-                f"<span style='color: {state_info['color']}; font-weight: 600; font-size: 14px;'>{state_info['text']}</span></div>"
-                f"<div style='color: #666; font-size: 14px;'>⏱️ Time Limit: {partition['timelimit']}</div>"
-                f"</div>"
-            )
-            
-            # Node usage progress bar
-            summary.append("<div style='margin: 10px 0;'>")
-            summary.append("<div style='font-size: 13px; color: #666; margin-bottom: 5px; font-weight: 600;'>📦 Node Usage:</div>")
-            summary.append(create_progress_bar(
-                partition['allocated_nodes'],
-                partition['total_nodes']
-            ))
-            summary.append("</div>")
-            
-            # CPU usage progress bar
-            summary.append("<div style='margin: 10px 0;'>")
-            summary.append("<div style='font-size: 13px; color: #666; margin-bottom: 5px; font-weight: 600;'>🔧 CPU Usage:</div>")
-            summary.append(create_progress_bar(
-                partition['allocated_cpus'],
-                partition['total_cpus']
-            ))
-            summary.append("</div>")
-            
-            summary.append(
-                f"<div style='margin-top: 10px; padding-top: 10px; border-top: 1px solid #eee; font-size: 13px; color: #666;'>"
-                f"<strong>Details:</strong> "
-                f"Idle Nodes: {partition['idle_nodes']} | "
-                f"Allocated Nodes: {partition['allocated_nodes']} | "
-                f"Total CPUs: {partition['total_cpus']} | "
-                f"Available CPUs: {partition['idle_cpus']}"
-                f"</div>"
-            )
-            
-            summary.append("</div>")
+        buf.write(
+            "<div style='margin: 30px 0 20px 0;'>\n"
+            "<h3 style='color: #764ba2; border-bottom: 3px solid #764ba2; padding-bottom: 10px;'>💻 CPU-Only Resources (Sorted by Availability)</h3>\n"
+            "</div>\n"
+            "<div style='background: #f8f9fa; padding: 15px; border-radius: 10px;'>\n"
+        )
         
-        summary.append("</div>")
+        buf.writelines(map(_render_partition_card, cpu_partitions))
+        buf.write("</div>\n")
     # If user requested GPU memory but nothing matched, show a warning
 
 
@@ -441,128 +631,211 @@ def get_available_resources(min_gpu_memory=0):
         # Sort by total available GPU memory (highest first)
         filtered_results.sort(key=lambda x: x['total_available_gpu_memory'], reverse=True)
         
-        summary.append("<div style='margin-top: 30px; padding: 20px; background: #e8f5e9; border-radius: 10px; border: 2px solid #4CAF50;'>")
-        summary.append(f"<h3 style='color: #2E7D32; margin-top: 0;'>✅ Best Available GPUs with ≥ {min_gpu_memory}GB Total Memory</h3>")
-        summary.append("<p style='color: #666; margin-bottom: 15px;'>Sorted by total available GPU memory (highest first)</p>")
-        summary.append("<table style='width: 100%; border-collapse: collapse; background: white; border-radius: 8px; overflow: hidden;'>")
-        summary.append("<thead><tr style='background: #4CAF50; color: white;'>")
-        summary.append("<th style='padding: 12px; text-align: left;'>Rank</th>")
-        summary.append("<th style='padding: 12px; text-align: left;'>Partition</th>")
-        summary.append("<th style='padding: 12px; text-align: center;'>Per GPU</th>")
-        summary.append("<th style='padding: 12px; text-align: center;'>Total Available GPU Memory</th>")
-        summary.append("<th style='padding: 12px; text-align: center;'>Available Nodes</th>")
-        summary.append("<th style='padding: 12px; text-align: center;'>Idle Nodes</th>")
-        summary.append("<th style='padding: 12px; text-align: left;'>Time Limit</th>")
-        summary.append("</tr></thead><tbody>")
+        buf.write(
+            "<div style='margin-top: 30px; padding: 20px; background: #e8f5e9; border-radius: 10px; border: 2px solid #4CAF50;'>\n"
+            f"<h3 style='color: #2E7D32; margin-top: 0;'>✅ Best Available GPUs with ≥ {min_gpu_memory}GB Total Memory</h3>\n"
+            "<p style='color: #666; margin-bottom: 15px;'>Sorted by total available GPU memory (highest first)</p>\n"
+            "<table style='width: 100%; border-collapse: collapse; background: white; border-radius: 8px; overflow: hidden;'>\n"
+            "<thead><tr style='background: #4CAF50; color: white;'>\n"
+            "<th style='padding: 12px; text-align: left;'>Rank</th>\n"
+            "<th style='padding: 12px; text-align: left;'>Partition</th>\n"
+            "<th style='padding: 12px; text-align: center;'>Per GPU</th>\n"
+            "<th style='padding: 12px; text-align: center;'>Total Available GPU Memory</th>\n"
+            "<th style='padding: 12px; text-align: center;'>Available Nodes</th>\n"
+            "<th style='padding: 12px; text-align: center;'>Idle Nodes</th>\n"
+            "<th style='padding: 12px; text-align: left;'>Time Limit</th>\n"
+            "</tr></thead><tbody>\n"
+        )
         
-        for i, result in enumerate(filtered_results, 1):
-            bg_color = "#f8f9fa" if i % 2 == 0 else "white"
-            
-            medal = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}."
-            
-            summary.append(
-                f"<tr style='background: {bg_color};'>"
-                f"<td style='padding: 12px; border-bottom: 1px solid #ddd; font-size: 16px;'>{medal}</td>"
-                f"<td style='padding: 12px; border-bottom: 1px solid #ddd;'><strong>{result['partition']}</strong></td>"
-                f"<td style='padding: 12px; text-align: center; border-bottom: 1px solid #ddd;'>{result['gpu_memory']}GB</td>"
-                f"<td style='padding: 12px; text-align: center; border-bottom: 1px solid #ddd;'><strong style='color: #4CAF50; font-size: 16px;'>{result['total_available_gpu_memory']}GB</strong><br><span style='font-size: 12px; color: #666;'>({result['gpu_memory']}GB × {result['available_nodes']} nodes)</span></td>"
-                f"<td style='padding: 12px; text-align: center; border-bottom: 1px solid #ddd;'><span style='background: #2196F3; color: white; padding: 4px 12px; border-radius: 12px; font-size: 13px; font-weight: 600;'>{result['available_nodes']}</span></td>"
-                f"<td style='padding: 12px; text-align: center; border-bottom: 1px solid #ddd;'><span style='background: #66BB6A; color: white; padding: 4px 12px; border-radius: 12px; font-size: 13px; font-weight: 600;'>{result['idle_nodes']}</span></td>"
-                f"<td style='padding: 12px; border-bottom: 1px solid #ddd;'>{result['timelimit']}</td>"
-                f"</tr>"
+        buf.writelines(
+            _RESULT_ROW_TEMPLATE.format(
+                bg_color="#f8f9fa" if i % 2 == 0 else "white",
+                medal=_MEDALS[i - 1] if i <= len(_MEDALS) else f"{i}.",
+                **result
             )
+            for i, result in enumerate(filtered_results, 1)
+        )
         
-        summary.append("</tbody></table>")
-        summary.append("</div>")
-    
-    # State Legend
-    summary.append("<div style='margin-top: 30px; padding: 20px; background: #f5f5f5; border-radius: 10px;'>")
-    summary.append("<h4 style='margin-top: 0; color: #333;'>📖 Legend</h4>")
-    summary.append("<div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 10px;'>")
-    
-    legend_items = [
-        ('🟢', '#66BB6A', 'Available', 'Resources ready to use'),
-        ('🟡', '#FFA726', 'Partially Available', 'Some resources in use'),
-        ('🔴', '#EF5350', 'Heavily Used', 'Most resources allocated'),
-        ('⚫', '#757575', 'Unavailable', 'Offline or maintenance')
-    ]
-    
-    for emoji, color, state, desc in legend_items:
-        summary.append(
-            f"<div style='background: white; padding: 10px; border-radius: 5px; border-left: 4px solid {color};'>"
-            f"{emoji} <strong>{state}</strong>: {desc}"
-            f"</div>"
+        buf.write(
+            "</tbody></table>\n"
+            "</div>\n"
         )
     
-    summary.append("</div>")
-    summary.append("</div>")
+    # State Legend
+    buf.write(_LEGEND_HTML)
     
-    return '\n'.join(summary)
+    return buf.getvalue()
 
-def generate_slurm_script(job_name, account, partition, nodes, ntasks_per_node, 
-                         cpus_per_task, memory, walltime, program_file, program_args,
-                         gpu_count, output_file, error_file, combine_output,
-                         array_indices, dependency_type, dependency_job_ids,
-                         mail_type, mail_user, export_env, nodelist, signal_time):
-    
-    # Enhanced error checking for required fields
-    errors = []
-    warnings = []
-    
-    # Required field validation
-    if not job_name or not job_name.strip():
-        errors.append("Job Name is required")
-    elif len(job_name.strip()) > 64:
-        warnings.append("Job Name is longer than 64 characters (may be truncated)")
+async def _fetch_resources():
+    """Query the cluster once; returns a (partitions, error, fetched_at) snapshot for _report_html"""
+    partitions, error, fetched_at = await get_detailed_partition_info()
+    # Stamp the report with when sinfo actually ran, which may predate this call by up to SINFO_TTL
+    return partitions, error, fetched_at.strftime('%Y-%m-%d %H:%M:%S')
+
+def _report_html(snapshot, min_gpu_memory):
+    """Render a snapshot from _fetch_resources, filtered by minimum total GPU memory"""
+    partitions, error, fetched_at = snapshot
     
-    if not program_file or not program_file.strip():
-        errors.append("Program/Script to Run is required")
-    elif not (program_file.strip().endswith(('.py', '.sh', '.R', '.m', '.cpp', '.c', '.f90', '.f', '.pl', '.rb', '.go', '.rs')) or 
-              program_file.strip().startswith(('./', '/'))):
-        warnings.append("Program file doesn't have a common extension - ensure it's executable")
+    if error:
+        return f"❌ **Error:** {error}"
     
-    if not walltime:
-        errors.append("Wall Time is required")
+    # Reuse the rendered report while the cluster state and filter are unchanged
+    key = (min_gpu_memory, tuple(sorted(
+        (p['name'], p['allocated_nodes'], p['idle_nodes'], p['other_nodes'], p['total_nodes'],
+         p['allocated_cpus'], p['idle_cpus'], p['other_cpus'], p['total_cpus'], p['timelimit'])
+        for p in partitions
+    )))
+    body = _HTML_CACHE.get(key)
+    if body is not None:
+        _HTML_CACHE.move_to_end(key)
     else:
-        # Validate walltime format
-        try:
-            parts = walltime.split(':')
-            if len(parts) != 3:
-                errors.append("Wall Time must be in HH:MM:SS format")
-            else:
-                hours, minutes, seconds = map(int, parts)
-                if hours < 0 or minutes < 0 or minutes >= 60 or seconds < 0 or seconds >= 60:
-                    errors.append("Invalid time values in Wall Time")
-        except ValueError:
-            errors.append("Wall Time must contain only numbers and colons (HH:MM:SS)")
+        body = _render_resources(partitions, min_gpu_memory)
+        _HTML_CACHE[key] = body
+        if len(_HTML_CACHE) > _HTML_CACHE_SIZE:
+            _HTML_CACHE.popitem(last=False)
     
-    # Additional validations with proper error handling
+    # Only the timestamp changes between calls, so it stays out of the cached body
+    return _HEADER_PREFIX + fetched_at + _HEADER_SUFFIX + body
+
+async def get_available_resources(min_gpu_memory=0):
+    """Get available GPU/CPU resources with detailed progress bars"""
+    return _report_html(await _fetch_resources(), min_gpu_memory)
+
+# Wall time in HH:MM:SS with minutes and seconds below 60
+_WALLTIME_RE = re.compile(r'^(\d+):([0-5]\d):([0-5]\d)$')
+
+# Array indices must contain at least one number somewhere
+_ARRAY_DIGIT_RE = re.compile(r'\d')
+
+# Dropdown placeholder choices that mean "don't emit this directive"
+_NONE = "None"
+_DEFAULT = "Default"
+
+# Program file extensions that don't trigger the "ensure it's executable" warning
+_PROG_EXTS = frozenset({'.py', '.sh', '.R', '.m', '.cpp', '.c', '.f90', '.f', '.pl', '.rb', '.go', '.rs'})
+
+# Job script header; only the warning comments and #SBATCH directives vary per call
+_SCRIPT_HEAD = """#!/bin/bash
+
+# Slurm job script generated by GUI
+{warnings}
+{directives}
+"""
+
+# Boilerplate between the directives and the run line, emitted verbatim
+_STATIC_TAIL = """
+# Available Slurm environment variables:
+# $SLURM_JOB_NAME - Job name
+# $SLURM_JOB_ID - Job ID
+# $SLURM_SUBMIT_DIR - Submit directory
+# $SLURM_SUBMIT_HOST - Submit host
+# $SLURM_JOB_NODELIST - Node list
+# $SLURM_JOB_PARTITION - Partition name
+# $SLURM_JOB_NUM_NODES - Number of allocated nodes
+# $SLURM_NTASKS - Number of processes
+# $SLURM_TASKS_PER_NODE - Processes per node
+# $SLURM_ARRAY_TASK_ID - Array task ID (if array job)
+
+# Change to the directory from which the job was submitted
+cd $SLURM_SUBMIT_DIR
+
+# Load required modules here
+# module load python/3.9
+# module load gcc/9.3.0
+
+# Run the program
+"""
+
+def _norm(value):
+    """Strip a free-text input, treating None and non-strings as empty"""
+    return value.strip() if isinstance(value, str) else ""
+
+def _choice(value, placeholder):
+    """Return a dropdown value, or "" when it is unset or the placeholder choice"""
+    return "" if value == placeholder else value or ""
+
+def _as_int(value):
+    """Convert a numeric input to int; Gradio sliders usually deliver ints already"""
+    return value if type(value) is int else int(value)
+
+def _try_int(value):
+    """Like _as_int, but None for values that don't convert"""
     try:
-        nodes_int = int(nodes)
-        if nodes_int < 1:
-            errors.append("Number of nodes must be at least 1")
+        return _as_int(value)
     except (ValueError, TypeError):
-        errors.append("Invalid nodes value")
+        return None
+
+# Validation rules as (check, message) over the normalized inputs, reported in this order
+_ERROR_RULES = (
+    (lambda ctx: not ctx['job_name'], "Job Name is required"),
+    (lambda ctx: not ctx['program_file'], "Program/Script to Run is required"),
+    (lambda ctx: not ctx['walltime'], "Wall Time is required"),
+    (lambda ctx: ctx['walltime'] and not _WALLTIME_RE.match(ctx['walltime']),
+     "Wall Time must be HH:MM:SS with valid ranges"),
+    (lambda ctx: ctx['nodes'] is None, "Invalid nodes value"),
+    (lambda ctx: ctx['nodes'] is not None and ctx['nodes'] < 1, "Number of nodes must be at least 1"),
+    (lambda ctx: ctx['gpu_count'] is None, "Invalid GPU count value"),
+    (lambda ctx: ctx['array_indices'] and not _ARRAY_DIGIT_RE.search(ctx['array_indices']),
+     "Array indices must contain numbers"),
+    (lambda ctx: ctx['dependency_type'] and not ctx['dependency_job_ids'],
+     "Dependency Job IDs required when dependency type is selected"),
+)
+
+_WARNING_RULES = (
+    (lambda ctx: len(ctx['job_name']) > 64, "Job Name is longer than 64 characters (may be truncated)"),
+    (lambda ctx: ctx['program_file'] and not (os.path.splitext(ctx['program_file'])[1] in _PROG_EXTS or
+                                              ctx['program_file'].startswith(('./', '/'))),
+     "Program file doesn't have a common extension - ensure it's executable"),
+    (lambda ctx: ctx['gpu_count'] and ctx['gpu_count'] > 0 and
+                 not ctx['partition'],
+     "GPU requested but no GPU partition selected"),
+    (lambda ctx: ctx['mail_type'] and not ctx['mail_user'],
+     "Email address recommended when email notifications are enabled"),
+)
+
+# Repeat clicks with unchanged inputs return the cached script; all inputs are hashable primitives
+@functools.lru_cache(maxsize=64)
+def generate_slurm_script(job_name, account, partition, nodes, ntasks_per_node, 
+                         cpus_per_task, memory, walltime, program_file, program_args,
+                         gpu_count, output_file, error_file, combine_output,
+                         array_indices, dependency_type, dependency_job_ids,
+                         mail_type, mail_user, export_env, nodelist, signal_time):
+    """Generate a Slurm job script (or an error report) from the form inputs"""
     
-    try:
-        gpu_count_int = int(gpu_count)
-        if gpu_count_int > 0 and (not partition or partition == "Default"):
-            warnings.append("GPU requested but no GPU partition selected")
-    except (ValueError, TypeError):
-        errors.append("Invalid GPU count value")
+    # Strip free-text inputs once; None becomes ""
+    job_name = _norm(job_name)
+    account = _norm(account)
+    walltime = _norm(walltime)
+    program_file = _norm(program_file)
+    program_args = _norm(program_args)
+    output_file = _norm(output_file)
+    error_file = _norm(error_file)
+    array_indices = _norm(array_indices)
+    dependency_job_ids = _norm(dependency_job_ids)
+    mail_user = _norm(mail_user)
+    nodelist = _norm(nodelist)
     
-    if array_indices and array_indices.strip():
-        try:
-            if not any(c.isdigit() for c in array_indices):
-                errors.append("Array indices must contain numbers")
-        except:
-            errors.append("Invalid array indices format")
+    # Map dropdown placeholders to "" once so later checks are plain truth tests
+    partition = _choice(partition, _DEFAULT)
+    memory = _choice(memory, _DEFAULT)
+    export_env = _choice(export_env, _DEFAULT)
+    dependency_type = _choice(dependency_type, _NONE)
+    mail_type = _choice(mail_type, _NONE)
     
-    if dependency_type != "None" and (not dependency_job_ids or not dependency_job_ids.strip()):
-        errors.append("Dependency Job IDs required when dependency type is selected")
+    # Convert the numeric inputs once; None marks a value that isn't a number
+    nodes_int, ntasks_int, cpus_int, gpu_int, signal_int = map(
+        _try_int, (nodes, ntasks_per_node, cpus_per_task, gpu_count, signal_time)
+    )
     
-    if mail_type != "None" and (not mail_user or not mail_user.strip()):
-        warnings.append("Email address recommended when email notifications are enabled")
+    # Run every validation rule against the normalized inputs
+    ctx = {
+        'job_name': job_name, 'program_file': program_file, 'walltime': walltime,
+        'nodes': nodes_int, 'gpu_count': gpu_int, 'partition': partition,
+        'array_indices': array_indices, 'dependency_type': dependency_type,
+        'dependency_job_ids': dependency_job_ids, 'mail_type': mail_type, 'mail_user': mail_user,
+    }
+    errors = [msg for check, msg in _ERROR_RULES if check(ctx)]
+    warnings = [msg for check, msg in _WARNING_RULES if check(ctx)]
     
     # Return errors or warnings
     if errors:
@@ -571,180 +844,207 @@ def generate_slurm_script(job_name, account, partition, nodes, ntasks_per_node,
             error_msg += "\n\n⚠️ WARNINGS:\n" + "\n".join(f"• {warning}" for warning in warnings)
         return error_msg
     
+    # Warning header comments
+    warning_lines = ""
     if warnings:
-        warning_msg = "⚠️ WARNINGS:\n" + "\n".join(f"• {warning}" for warning in warnings) + "\n\n"
-    else:
-        warning_msg = ""
+        warning_lines = "# ⚠️ WARNINGS:\n" + "".join(f"# • {warning}\n" for warning in warnings) + "#\n"
     
-    # Start building the script
-    script = "#!/bin/bash\n\n"
-    script += "# Slurm job script generated by GUI\n"
-    
-    if warnings:
-        for line in warning_msg.strip().split('\n'):
-            if line:
-                script += f"# {line}\n"
-        script += "#\n"
-    
-    script += "\n"
+    # #SBATCH directives, in emission order
+    directives = {}
     
     # Required directives
-    script += f"#SBATCH --job-name={job_name}\n"
-    script += f"#SBATCH --time={walltime}\n"
+    directives["job-name"] = job_name
+    directives["time"] = walltime
     
     # Optional account
-    if account and account.strip():
-        script += f"#SBATCH --account={account}\n"
+    if account:
+        directives["account"] = account
     
     # Partition/Queue
-    if partition and partition != "Default":
-        script += f"#SBATCH --partition={partition}\n"
+    if partition:
+        directives["partition"] = partition
     
-    # Resource allocation with proper error handling
-    try:
-        nodes_int = int(nodes)
-        ntasks_int = int(ntasks_per_node)
-        cpus_int = int(cpus_per_task)
-        gpu_int = int(gpu_count)
-        signal_int = int(signal_time)
-        
-        script += f"#SBATCH --nodes={nodes_int}\n"
-        if ntasks_int > 0:
-            script += f"#SBATCH --ntasks-per-node={ntasks_int}\n"
-        if cpus_int > 0:
-            script += f"#SBATCH --cpus-per-task={cpus_int}\n"
-        
-        # Memory
-        if memory and memory != "Default":
-            script += f"#SBATCH --mem={memory}\n"
-        
-        # GPU resources
-        if gpu_int > 0:
-            script += f"#SBATCH --gres=gpu:{gpu_int}\n"
-    except (ValueError, TypeError):
+    # Resource allocation; nodes and GPU count were already checked by the rules
+    if None in (ntasks_int, cpus_int, signal_int):
         return "❌ ERROR: Invalid numeric values in resource allocation"
     
+    directives["nodes"] = nodes_int
+    if ntasks_int > 0:
+        directives["ntasks-per-node"] = ntasks_int
+    if cpus_int > 0:
+        directives["cpus-per-task"] = cpus_int
+    
+    # Memory
+    if memory:
+        directives["mem"] = memory
+    
+    # GPU resources
+    if gpu_int > 0:
+        directives["gres"] = f"gpu:{gpu_int}"
+    
     # Output/Error files
-    if combine_output:
-        output_name = output_file if output_file.strip() else f"{job_name}_%j.out"
-        script += f"#SBATCH --output={output_name}\n"
-    else:
-        output_name = output_file if output_file.strip() else f"{job_name}_%j.out"
-        error_name = error_file if error_file.strip() else f"{job_name}_%j.err"
-        script += f"#SBATCH --output={output_name}\n"
-        script += f"#SBATCH --error={error_name}\n"
+    directives["output"] = output_file or f"{job_name}_%j.out"
+    if not combine_output:
+        directives["error"] = error_file or f"{job_name}_%j.err"
     
     # Job arrays
-    if array_indices and array_indices.strip():
-        script += f"#SBATCH --array={array_indices}\n"
+    if array_indices:
+        directives["array"] = array_indices
     
     # Job dependencies
-    if dependency_type != "None" and dependency_job_ids and dependency_job_ids.strip():
-        script += f"#SBATCH --dependency={dependency_type}:{dependency_job_ids}\n"
+    if dependency_type and dependency_job_ids:
+        directives["dependency"] = f"{dependency_type}:{dependency_job_ids}"
     
     # Email notifications
-    if mail_type != "None":
-        script += f"#SBATCH --mail-type={mail_type}\n"
-        if mail_user and mail_user.strip():
-            script += f"#SBATCH --mail-user={mail_user}\n"
+    if mail_type:
+        directives["mail-type"] = mail_type
+        if mail_user:
+            directives["mail-user"] = mail_user
     
     # Environment export
-    if export_env != "Default":
-        script += f"#SBATCH --export={export_env}\n"
+    if export_env:
+        directives["export"] = export_env
     
     # Specific node list
-    if nodelist and nodelist.strip():
-        script += f"#SBATCH --nodelist={nodelist}\n"
+    if nodelist:
+        directives["nodelist"] = nodelist
     
     # Signal before job termination
     if signal_int > 0:
-        script += f"#SBATCH --signal=B:USR1@{signal_int}\n"
-    
-    script += "\n"
-    
-    # Add environment variable examples as comments
-    script += "# Available Slurm environment variables:\n"
-    script += "# $SLURM_JOB_NAME - Job name\n"
-    script += "# $SLURM_JOB_ID - Job ID\n"
-    script += "# $SLURM_SUBMIT_DIR - Submit directory\n"
-    script += "# $SLURM_SUBMIT_HOST - Submit host\n"
-    script += "# $SLURM_JOB_NODELIST - Node list\n"
-    script += "# $SLURM_JOB_PARTITION - Partition name\n"
-    script += "# $SLURM_JOB_NUM_NODES - Number of allocated nodes\n"
-    script += "# $SLURM_NTASKS - Number of processes\n"
-    script += "# $SLURM_TASKS_PER_NODE - Processes per node\n"
-    script += "# $SLURM_ARRAY_TASK_ID - Array task ID (if array job)\n\n"
-    
-    # Change to submit directory
-    script += "# Change to the directory from which the job was submitted\n"
-    script += "cd $SLURM_SUBMIT_DIR\n\n"
-    
-    # Load modules section
-    script += "# Load required modules here\n"
-    script += "# module load python/3.9\n"
-    script += "# module load gcc/9.3.0\n\n"
+        directives["signal"] = f"B:USR1@{signal_int}"
     
     # Main program execution
-    script += "# Run the program\n"
-    if program_file.startswith('./') or program_file.startswith('/'):
-        script += f"python {program_file}"
+    if program_file.startswith(('./', '/')):
+        run_line = f"python {program_file}"
     else:
-        script += f"python ./{program_file}"
+        run_line = f"python ./{program_file}"
     
-    if program_args and program_args.strip():
-        script += f" {program_args}"
+    if program_args:
+        run_line += f" {program_args}"
     
-    script += "\n"
-    
-    return script
+    head = _SCRIPT_HEAD.format(
+        warnings=warning_lines,
+        directives="\n".join(f"#SBATCH --{flag}={value}" for flag, value in directives.items())
+    )
+    return head + _STATIC_TAIL + run_line + "\n"
+
+# Custom CSS for better styling
+_CUSTOM_CSS = """
+.gradio-container {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif !important;
+}
+.gr-button-primary {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
+    border: none !important;
+    font-weight: 600 !important;
+}
+.gr-button-primary:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 4px 12px rgba(102, 126, 234, 0.4) !important;
+}
+.gr-box {
+    border-radius: 8px !important;
+}
+h1, h2, h3, h4 {
+    font-weight: 600 !important;
+}
+"""
+
+# App banner shown above the tabs
+_HEADER_HTML = """
+<div style='text-align: center; padding: 40px 20px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; border-radius: 15px; margin-bottom: 30px; box-shadow: 0 8px 32px rgba(0,0,0,0.1);'>
+    <h1 style='margin: 0; font-size: 42px; font-weight: 700; text-shadow: 2px 2px 4px rgba(0,0,0,0.2);'>🚀 Slurm Script Generator</h1>
+    <p style='margin: 15px 0 0 0; font-size: 18px; opacity: 0.95;'>Generate professional Slurm job scripts and monitor cluster resources</p>
+</div>
+"""
+
+# Script Generator tab intro
+_QUICK_START_MD = """
+### Quick Start Guide
+
+1. **Fill Required Fields** (marked with ⭐)
+2. **Configure Resources** based on your job needs
+3. **Generate Script** and copy the output
+4. **Submit** using: `sbatch your_script.sh`
+
+💡 **Tip:** Check the Resource Monitor tab to find available GPUs before submitting!
+"""
+
+# Resource Monitor tab intro
+_MONITOR_INTRO_MD = """
+### 🎮 Real-Time Cluster Resource Monitor
+
+View detailed resource usage with progress bars showing exact node and CPU allocation.
+
+**Filter Logic:** Total Available GPU Memory = Per-GPU Memory × Available Nodes
+- Example: 24GB GPU with 2 available nodes = 48GB total available memory
+- Partitions are ranked by total available GPU memory (highest first)
+"""
+
+# Shown in the resource panel until the first refresh replaces it
+_RESOURCE_PLACEHOLDER_HTML = (
+    "<p style='text-align: center; padding: 40px; color: #666;'>"
+    "Click '🔄 Refresh Resources' to load current cluster status...</p>"
+)
+
+# Resource Monitor quick reference: GPU memory table and filtering explainer
+_GPU_TABLE_MD = """
+### 💾 Common GPU Memory Sizes
+
+| GPU Model | Memory |
+|-----------|--------|
+| RTX 2080 Ti | 11 GB |
+| V100 | 16 GB |
+| A5000 | 24 GB |
+| A5500 | 24 GB |
+| A100 | 40 GB |
+| L40S | 48 GB |
+| H200 | 141 GB |
+"""
+
+_FILTER_EXPLAINER_MD = """
+### 💡 How Filtering Works
+
+**Total Available GPU Memory = Per-GPU Memory × Available Nodes**
+
+**Examples:**
+- A5000 (24GB) with 2 nodes = **48GB total** ✅
+- V100 (16GB) with 3 nodes = **48GB total** ✅
+- 2080Ti (11GB) with 1 node = **11GB total** ❌
+
+**When you set filter to 40GB:**
+- Shows partitions with ≥40GB total available
+- Ranked by total GPU memory (highest first)
+- Considers both per-GPU size and node count
+"""
+
+# Footer shown below the tabs
+_FOOTER_HTML = """
+<div style='text-align: center; padding: 20px; margin-top: 30px; color: #666; border-top: 1px solid #ddd;'>
+    <p style='margin: 0;'>💻 Made with Gradio | 📚 <a href='https://slurm.schedmd.com/' target='_blank'>Slurm Documentation</a></p>
+</div>
+"""
+
+# Dropdown choices
+_PARTITIONS = (_DEFAULT, "standard", "gpuq", "a5000", "a5500", "a100", "h200", "v100", "2080ti",
+               "a5000_w", "a5500_w", "l40s_nova", "l40s_indrani", "preemptable")
+_MEMORY_CHOICES = (_DEFAULT, "1G", "2G", "4G", "8G", "16G", "32G", "64G", "128G", "256G")
+_WALLTIMES = ("00:15:00", "00:30:00", "01:00:00", "02:00:00", "04:00:00", "08:00:00", "12:00:00", "24:00:00")
+_DEP_TYPES = (_NONE, "after", "afterok", "afternotok", "afterany")
+_MAIL_TYPES = (_NONE, "BEGIN", "END", "FAIL", "ALL", "BEGIN,END", "END,FAIL", "BEGIN,END,FAIL")
+_EXPORT_ENV = (_DEFAULT, "ALL", "NONE")
 
 # Define all the input components
-def create_interface():
-    # Custom CSS for better styling
-    custom_css = """
-    .gradio-container {
-        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif !important;
-    }
-    .gr-button-primary {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-        border: none !important;
-        font-weight: 600 !important;
-    }
-    .gr-button-primary:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 12px rgba(102, 126, 234, 0.4) !important;
-    }
-    .gr-box {
-        border-radius: 8px !important;
-    }
-    h1, h2, h3, h4 {
-        font-weight: 600 !important;
-    }
-    """
-    
-    with gr.Blocks(title="🚀 Slurm Script Generator", theme=gr.themes.Soft(), css=custom_css) as interface:
+def _build_interface():
+    with gr.Blocks(title="🚀 Slurm Script Generator", theme=gr.themes.Soft(), css=_CUSTOM_CSS) as interface:
         
         # Main header
-        gr.HTML("""
-        <div style='text-align: center; padding: 40px 20px; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; border-radius: 15px; margin-bottom: 30px; box-shadow: 0 8px 32px rgba(0,0,0,0.1);'>
-            <h1 style='margin: 0; font-size: 42px; font-weight: 700; text-shadow: 2px 2px 4px rgba(0,0,0,0.2);'>🚀 Slurm Script Generator</h1>
-            <p style='margin: 15px 0 0 0; font-size: 18px; opacity: 0.95;'>Generate professional Slurm job scripts and monitor cluster resources</p>
-        </div>
-        """)
+        gr.HTML(_HEADER_HTML)
         
         with gr.Tabs() as tabs:
             # Tab 1: Script Generator
             with gr.TabItem("📝 Script Generator", id=0):
-                gr.Markdown("""
-                ### Quick Start Guide
-                
-                1. **Fill Required Fields** (marked with ⭐)
-                2. **Configure Resources** based on your job needs
-                3. **Generate Script** and copy the output
-                4. **Submit** using: `sbatch your_script.sh`
-                
-                💡 **Tip:** Check the Resource Monitor tab to find available GPUs before submitting!
-                """)
+                gr.Markdown(_QUICK_START_MD)
                 
                 gr.Markdown("---")
                 
@@ -762,9 +1062,8 @@ def create_interface():
                             info="Optional: Billing account"
                         )
                         partition = gr.Dropdown(
-                            choices=["Default", "standard", "gpuq", "a5000", "a5500", "a100", "h200", "v100", "2080ti", 
-                                   "a5000_w", "a5500_w", "l40s_nova", "l40s_indrani", "preemptable"],
-                            value="Default",
+                            choices=_PARTITIONS,
+                            value=_DEFAULT,
                             label="Partition/Queue",
                             info="Select compute partition (check Resource Monitor)"
                         )
@@ -796,12 +1095,12 @@ def create_interface():
                             info="0 = auto"
                         )
                         memory = gr.Dropdown(
-                            choices=["Default", "1G", "2G", "4G", "8G", "16G", "32G", "64G", "128G", "256G"],
+                            choices=_MEMORY_CHOICES,
                             value="8G",
                             label="💾 Memory per Node"
                         )
                         walltime = gr.Dropdown(
-                            choices=["00:15:00", "00:30:00", "01:00:00", "02:00:00", "04:00:00", "08:00:00", "12:00:00", "24:00:00"],
+                            choices=_WALLTIMES,
                             value="01:00:00",
                             label="⭐ ⏱️ Wall Time (HH:MM:SS)",
                             info="Required: Maximum runtime",
@@ -840,8 +1139,8 @@ def create_interface():
                             info="For parameter sweeps"
                         )
                         dependency_type = gr.Dropdown(
-                            choices=["None", "after", "afterok", "afternotok", "afterany"],
-                            value="None",
+                            choices=_DEP_TYPES,
+                            value=_NONE,
                             label="Job Dependency Type"
                         )
                         dependency_job_ids = gr.Textbox(
@@ -853,7 +1152,7 @@ def create_interface():
                     with gr.Column(scale=1):
                         gr.Markdown("### 📧 Email Notifications")
                         mail_type = gr.Dropdown(
-                            choices=["None", "BEGIN", "END", "FAIL", "ALL", "BEGIN,END", "END,FAIL", "BEGIN,END,FAIL"],
+                            choices=_MAIL_TYPES,
                             value="FAIL",
                             label="Notification Events"
                         )
@@ -865,8 +1164,8 @@ def create_interface():
                     with gr.Column(scale=1):
                         gr.Markdown("### 🔧 Advanced Options")
                         export_env = gr.Dropdown(
-                            choices=["Default", "ALL", "NONE"],
-                            value="Default",
+                            choices=_EXPORT_ENV,
+                            value=_DEFAULT,
                             label="Export Environment Variables"
                         )
                         nodelist = gr.Textbox(
@@ -906,15 +1205,7 @@ def create_interface():
             
             # Tab 2: Resource Monitor
             with gr.TabItem("📊 Resource Monitor", id=1):
-                gr.Markdown("""
-                ### 🎮 Real-Time Cluster Resource Monitor
-                
-                View detailed resource usage with progress bars showing exact node and CPU allocation.
-                
-                **Filter Logic:** Total Available GPU Memory = Per-GPU Memory × Available Nodes
-                - Example: 24GB GPU with 2 available nodes = 48GB total available memory
-                - Partitions are ranked by total available GPU memory (highest first)
-                """)
+                gr.Markdown(_MONITOR_INTRO_MD)
                 
                 with gr.Row():
                     gpu_memory_filter = gr.Slider(
@@ -925,24 +1216,33 @@ def create_interface():
                     )
                     refresh_btn = gr.Button("🔄 Refresh Resources", variant="primary", size="lg", scale=1)
                 
-                resource_output = gr.HTML(
-                    value="<p style='text-align: center; padding: 40px; color: #666;'>Click '🔄 Refresh Resources' to load current cluster status...</p>"
-                )
+                resource_output = gr.HTML(value=_RESOURCE_PLACEHOLDER_HTML)
+                
+                # Last fetched cluster snapshot, so filter changes don't re-query the cluster
+                raw_state = gr.State(None)
                 
                 # Auto-refresh function
-                def refresh_resources(min_gpu_mem):
-                    return get_available_resources(min_gpu_mem)
+                async def refresh_resources(min_gpu_mem):
+                    snapshot = await _fetch_resources()
+                    return snapshot, _report_html(snapshot, min_gpu_mem)
+                
+                # Re-filter the stored snapshot; only fetch if nothing has been loaded yet
+                async def filter_resources(snapshot, min_gpu_mem):
+                    if snapshot is None:
+                        return await refresh_resources(min_gpu_mem)
+                    return snapshot, _report_html(snapshot, min_gpu_mem)
                 
                 refresh_btn.click(
                     fn=refresh_resources,
                     inputs=[gpu_memory_filter],
-                    outputs=resource_output
+                    outputs=[raw_state, resource_output]
                 )
                 
-                gpu_memory_filter.change(
-                    fn=refresh_resources,
-                    inputs=[gpu_memory_filter],
-                    outputs=resource_output
+                # Refilter once when the user lets go of the slider, not on every tick of a drag
+                gpu_memory_filter.release(
+                    fn=filter_resources,
+                    inputs=[raw_state, gpu_memory_filter],
+                    outputs=[raw_state, resource_output]
                 )
                 
                 gr.Markdown("---")
@@ -950,46 +1250,26 @@ def create_interface():
                 # Quick reference in columns
                 with gr.Row():
                     with gr.Column():
-                        gr.Markdown("""
-                        ### 💾 Common GPU Memory Sizes
-                        
-                        | GPU Model | Memory |
-                        |-----------|--------|
-                        | RTX 2080 Ti | 11 GB |
-                        | V100 | 16 GB |
-                        | A5000 | 24 GB |
-                        | A5500 | 24 GB |
-                        | A100 | 40 GB |
-                        | L40S | 48 GB |
-                        | H200 | 141 GB |
-                        """)
+                        gr.Markdown(_GPU_TABLE_MD)
                     
                     with gr.Column():
-                        gr.Markdown("""
-                        ### 💡 How Filtering Works
-                        
-                        **Total Available GPU Memory = Per-GPU Memory × Available Nodes**
-                        
-                        **Examples:**
-                        - A5000 (24GB) with 2 nodes = **48GB total** ✅
-                        - V100 (16GB) with 3 nodes = **48GB total** ✅
-                        - 2080Ti (11GB) with 1 node = **11GB total** ❌
-                        
-                        **When you set filter to 40GB:**
-                        - Shows partitions with ≥40GB total available
-                        - Ranked by total GPU memory (highest first)
-                        - Considers both per-GPU size and node count
-                        """)
+                        gr.Markdown(_FILTER_EXPLAINER_MD)
         
         # Footer
-        gr.HTML("""
-        <div style='text-align: center; padding: 20px; margin-top: 30px; color: #666; border-top: 1px solid #ddd;'>
-            <p style='margin: 0;'>💻 Made with Gradio | 📚 <a href='https://slurm.schedmd.com/' target='_blank'>Slurm Documentation</a></p>
-        </div>
-        """)
+        gr.HTML(_FOOTER_HTML)
     
     return interface
 
+# Built on first use; the Blocks tree is reused rather than rebuilt on later calls
+_INTERFACE = None
+
+def create_interface():
+    """Return the Gradio interface, building it on the first call"""
+    global _INTERFACE
+    if _INTERFACE is None:
+        _INTERFACE = _build_interface()
+    return _INTERFACE
+
 # Launch the interface
 if __name__ == "__main__":
     interface = create_interface()